@@ -3,16 +3,19 @@
 from typing import Callable
 
 from argparse import FileType, Namespace
+from itertools import chain
 import sys
 
 from carabiner.cliutils import CLIApp, CLICommand, CLIOption, clicommand
-from carabiner.pd import read_table
 
 from .fasta import FastaCollection
 from .gff import GffFile
+from .tables import _load_table
 
 __version__ = '0.0.2.post1'
 
+_TABLE_CHUNKSIZE = 65536
+
 def _allow_broken_pipe(f: Callable) -> Callable:
 
     def _f(*args, **kwargs):
@@ -44,13 +47,19 @@ def _gff2table(args: Namespace) -> None:
 @clicommand(message='Generating FASTA from tables with the following parameters')
 def _table2fasta(args: Namespace) -> None:
 
-    table = read_table(args.input, 
-                       format=args.format)
+    tables = _load_table(args.input, 
+                         format=args.format,
+                         chunksize=_TABLE_CHUNKSIZE,
+                         sheet_name=args.worksheet,
+                         columns=[args.sequence] + args.name + args.description)
     
-    fasta_collection = FastaCollection.from_pandas(table, 
-                                                   sequence=args.sequence,
-                                                   names=args.name, 
-                                                   descriptions=args.description)
+    # only one chunk of the table is in memory at a time
+    sequences = chain.from_iterable(FastaCollection.from_pandas(table, 
+                                                                sequence=args.sequence,
+                                                                names=args.name, 
+                                                                descriptions=args.description).sequences
+                                    for table in tables)
+    fasta_collection = FastaCollection(sequences)
     
     _allow_broken_pipe(fasta_collection.write)(file=args.output)
     
@@ -69,6 +78,16 @@ def main() -> None:
                         default='TSV',
                         choices=['TSV', 'CSV'],
                         help='File format.')
+    table_input = CLIOption('input', 
+                            type=str,
+                            default='-',
+                            nargs='?',
+                            help='Input table file. Use "-" for STDIN.')
+    table_format = CLIOption('--format', '-f', 
+                             type=str,
+                             default=None,
+                             choices=['TSV', 'CSV', 'XLSX'],
+                             help='File format. Default: infer from file extension, otherwise TSV.')
     metadata = CLIOption('--metadata', '-m', 
                         action='store_true',
                         help='Write GFF header as commented lines.')
@@ -96,8 +115,9 @@ def main() -> None:
                              'Concatenates values with ";", '
                              'replaces spaces with "_". Default: don\'t use.')
     worksheet = CLIOption('--worksheet', '-w', 
-                          type=str, default='Sheet 1',
-                          help='For XLSX files, the worksheet to take the table from.')
+                          type=str, default=0,
+                          help='For XLSX files, the worksheet to take the table from. '
+                               'Default: first worksheet.')
 
     gff2table = CLICommand("gff2table",
                            description="Convert a GFF to a TSV file.",
@@ -106,7 +126,7 @@ def main() -> None:
     table2fasta = CLICommand("table2fasta",
                              description="Convert a CSV or TSV of sequences to a FASTA file.",
                              main=_table2fasta,
-                             options=[inputs, format, sequence, name, description, worksheet, outputs])
+                             options=[table_input, table_format, sequence, name, description, worksheet, outputs])
 
     app = CLIApp("bioino",
                  version=__version__,
@@ -4,15 +4,57 @@ from typing import Iterable, Optional, Union
 
 from dataclasses import dataclass, field
 from io import TextIOWrapper
-from itertools import chain
+from itertools import chain, repeat
+import re
+import sys
 import textwrap
 
 from carabiner.cast import cast
-from pandas import DataFrame
+from pandas import DataFrame, Series
+from pandas.api.types import is_numeric_dtype
 
-from .tables import _sanitize_columns
+from .tables import _DATACLASS_SLOTS, _sanitize_columns
 
-@dataclass
+_LINE_WIDTH = 80
+_WRITE_BUFFER_SIZE = 1 << 20  # characters
+_WRAP_BREAK_RE = re.compile(r'[\s-]')  # where textwrap could break a line early
+
+
+def _column_to_str(column: Series, 
+                   space: str) -> Series:
+
+    str_column = column.astype(str)
+
+    if str_column.hasnans:
+
+        # match `str()` of missing values, like "nan" or "None"
+        str_column = str_column.fillna(column[str_column.isna()].map(str))
+
+    if is_numeric_dtype(column):  # numbers are never written with spaces
+
+        return str_column
+    
+    else:
+
+        return str_column.str.replace(' ', space, regex=False)
+
+
+def _join_columns(columns: Iterable[Series], 
+                  sep: str,
+                  n: int) -> Iterable[str]:
+
+    columns = list(columns)
+
+    if len(columns) == 0:
+
+        return repeat('', n)
+    
+    else:
+
+        return columns[0].str.cat(columns[1:], sep=sep).to_numpy()
+
+
+@dataclass(**_DATACLASS_SLOTS)
 class FastaSequence:
 
     """Object which gives a fasta-formatted sequence when printed.
@@ -48,7 +90,14 @@ class FastaSequence:
 
         """Show the FASTA-formatted sequence."""
 
-        seq = '\n'.join(textwrap.wrap(self.sequence, width=80))
+        if _WRAP_BREAK_RE.search(self.sequence) is None:
+
+            seq = '\n'.join(self.sequence[i:(i + _LINE_WIDTH)] 
+                             for i in range(0, len(self.sequence), _LINE_WIDTH))
+        
+        else:
+
+            seq = '\n'.join(textwrap.wrap(self.sequence, width=_LINE_WIDTH))
 
         return f">{self.name} {self.description}\n{seq}"
 
@@ -58,7 +107,7 @@ class FastaSequence:
         return print(self, file=file)
     
 
-@dataclass
+@dataclass(**_DATACLASS_SLOTS)
 class FastaCollection:
 
     """Collection of FASTA sequences for reading and writing.
@@ -178,28 +227,30 @@ class FastaCollection:
         names = cast(names, to=list)
         descriptions = cast(descriptions, to=list)
 
-        columns = list(_sanitize_columns(chain(names, descriptions, cast(sequence, to=list))))
+        columns = _sanitize_columns(chain(names, descriptions, cast(sequence, to=list)))
 
-        cols_in_data = [column in data for column in columns]
-        cols_not_in_data = [column for column in columns if column not in data]
+        data_columns = set(data.columns)
+        cols_not_in_data = [column for column in columns if column not in data_columns]
 
-        if not all(cols_in_data):
+        if len(cols_not_in_data) > 0:
             
             raise KeyError('Some requested columns not in the table: '
                            '"{}"'.format('", "'.join(cols_not_in_data)))
         
-        data = data[columns]
+        n_names = len(names)
+        names, descriptions, sequence = columns[:n_names], columns[n_names:-1], columns[-1]
 
-        for row in data.itertuples():
+        clean_names = (_column_to_str(data[name], space='-') for name in names)
+        clean_desc = (desc + '=' + _column_to_str(data[desc], space='_') 
+                      for desc in descriptions)
+        name_values = _join_columns(clean_names, sep=name_sep, n=data.shape[0])
+        description_values = _join_columns(clean_desc, sep=desc_sep, n=data.shape[0])
 
-            clean_names = (str(getattr(row, name)).replace(' ', '-') for name in names)
-            name = name_sep.join(clean_names)
-            clean_desc = ('{}={}'.format(desc, str(getattr(row, desc)).replace(' ', '_')) 
-                          for desc in descriptions)
-            decription = desc_sep.join(clean_desc)
-            seq = getattr(row, sequence)
+        for name, description, seq in zip(name_values, 
+                                          description_values, 
+                                          data[sequence].to_numpy()):
 
-            yield FastaSequence(name, decription, seq)
+            yield FastaSequence(name, description, seq)
 
     @classmethod
     def from_pandas(cls, 
@@ -304,8 +355,25 @@ class FastaCollection:
             
         """
         
+        file = sys.stdout if file is None else file
+        batch, batch_size = [], 0
+
         for fasta_seq in self.sequences:
 
-            fasta_seq.write(file=file)
+            record = str(fasta_seq)
+            batch.append(record)
+            batch_size += len(record)
+
+            # flush by size, so long sequences aren't held in memory together
+            if batch_size >= _WRITE_BUFFER_SIZE:
+
+                file.write('\n'.join(batch))
+                file.write('\n')
+                batch, batch_size = [], 0
+
+        if len(batch) > 0:
+
+            file.write('\n'.join(batch))
+            file.write('\n')
 
         return None
\ No newline at end of file
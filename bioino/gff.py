@@ -4,23 +4,48 @@ Makes an attempt to conform to GFF3 but makes no guarantees.
 
 """
 
-from typing import Dict, Iterable, Mapping, Optional, Tuple, Union
+from typing import Dict, Iterable, List, Mapping, NamedTuple, Optional, Tuple, Union
 
 from collections import defaultdict
+from collections.abc import Mapping as MappingABC
+from concurrent.futures import ProcessPoolExecutor
 import csv
-from dataclasses import asdict, dataclass, field, fields, replace
-from io import TextIOWrapper
+from dataclasses import InitVar, dataclass, field, fields, replace
+from io import BytesIO, TextIOWrapper
 from itertools import chain
+import os
+import re
 import sys
 
 from carabiner import print_err
 from carabiner.cast import cast
+from carabiner.itertools import batched
+import numpy as np
+from pandas import DataFrame, concat, read_csv
 from tqdm.auto import tqdm
 
+from .tables import _ARROW_AVAILABLE, _DATACLASS_SLOTS, pa, pacsv
+
+try:
+    from numba import njit
+except ImportError:
+    _NUMBA_AVAILABLE = False
+else:
+    _NUMBA_AVAILABLE = True
+
 _GFF_COLNAMES = ('seqid', 'source', 'feature', 
                 'start', 'end', 'score', 
                 'strand', 'phase', 'attribute')
-_GFF_FEATURE_BLOCKLIST = ('region', 'repeat_region')
+_GFF_FEATURE_BLOCKLIST = frozenset(('region', 'repeat_region'))
+_ATTR_RE = re.compile(r'([^=;\s][^=;]*)=([^;]*)')
+_ATTR_STRING_RE = re.compile(r'[^=;\s][^=;]*=[^;]*(?:;[^=;\s][^=;]*=[^;]*)*')
+_LOCUS_TAG_PREFIXES = ('', '_up-', '_down-')
+_WRITE_BATCH_SIZE = 4096
+
+
+def _skip_comment_row(row) -> str:
+
+    return 'skip' if row.text.startswith('#') else 'error'
 
 
 def _cast_to_file_handle(file: Union[str, TextIOWrapper]) -> TextIOWrapper:
@@ -33,7 +58,7 @@ def _cast_to_file_handle(file: Union[str, TextIOWrapper]) -> TextIOWrapper:
 
         return cast(file, to=TextIOWrapper)
 
-@dataclass
+@dataclass(**_DATACLASS_SLOTS)
 class GffMetadatum:
 
     """GFF-formatted metadata line.
@@ -96,15 +121,16 @@ class GffMetadatum:
         return None
         
 
-@dataclass
+@dataclass(**_DATACLASS_SLOTS)
 class GffMetadata:
 
     """GFF-formatted metadata.
 
     Attributes
     ----------
-    metadata : Tuple[GffMetadatum]
-        Tuple of metadata lines.
+    data : Tuple[GffMetadatum]
+        Tuple of metadata lines. Can be instantiated with an iterable of
+        `GffMetadatum` or tuples of their arguments, or another `GffMetadata`.
 
     Methods
     -------
@@ -121,6 +147,8 @@ class GffMetadata:
     >>> print(metadata)  # doctest: +NORMALIZE_WHITESPACE
     ##meta1 item1
     #meta2 item2    comment
+    >>> GffMetadata(metadata).data is metadata.data
+    True
 
     """
 
@@ -128,6 +156,11 @@ class GffMetadata:
 
     def __post_init__(self):
 
+        if isinstance(self.data, GffMetadata):
+
+            self.data = self.data.data
+            return None
+
         new_metadata = []
 
         for item in self.data:
@@ -136,7 +169,7 @@ class GffMetadata:
 
                 new_metadatum = item
 
-            elif isinstance(item, Iterable) and not isinstance(item, str):
+            elif isinstance(item, (tuple, list)):
 
                 new_metadatum = GffMetadatum(*item)
 
@@ -164,7 +197,7 @@ class GffMetadata:
         return print(str(self), file=file)
 
 
-@dataclass
+@dataclass(**_DATACLASS_SLOTS)
 class GffColumns:
 
     """GFF-formatted columns.
@@ -192,12 +225,18 @@ class GffColumns:
     -------
     __str__()
         Show the GFF-formatted columns.
+    as_tuple()
+        Convert to tuple of columns in GFF order.
+    as_dict()
+        Convert to dictionary.
 
     Examples
     --------
     >>> columns = "NC_000913.3   GenBank exon    1   100 .   +   .".split()
     >>> print(GffColumns(*columns))  # doctest: +NORMALIZE_WHITESPACE
     NC_000913.3 GenBank exon    1       100     .       +       .
+    >>> GffColumns(*columns).as_tuple()
+    ('NC_000913.3', 'GenBank', 'exon', 1, 100, '.', '+', '.')
 
     """
 
@@ -220,15 +259,45 @@ class GffColumns:
 
         """Show the GFF-formatted columns."""
 
-        return '\t'.join(map(str, self.as_dict().values()))
+        return '\t'.join(map(str, self.as_tuple()))
+    
+
+    def as_tuple(self) -> tuple:
+
+        """Convert to tuple of columns in GFF order."""
+
+        return (self.seqid, self.source, self.feature, 
+                self.start, self.end, self.score, 
+                self.strand, self.phase)
     
 
     def as_dict(self) -> dict:
+
+        """Convert to dictionary."""
         
-        return asdict(self)
+        return {'seqid': self.seqid, 
+                'source': self.source, 
+                'feature': self.feature, 
+                'start': self.start, 
+                'end': self.end, 
+                'score': self.score, 
+                'strand': self.strand, 
+                'phase': self.phase}
+
+
+def _has_repeated_keys(attributes: str) -> bool:
+
+    # only for strings matching _ATTR_STRING_RE, where ';' separates pairs
+    keys = [pair.partition('=')[0] for pair in attributes.split(';')]
+
+    return len(set(keys)) < len(keys)
 
 
-@dataclass
+_GFF_COL_FIELD_NAMES = tuple(f.name for f in fields(GffColumns))
+_GFF_COL_FIELD_NAME_SET = frozenset(_GFF_COL_FIELD_NAMES)
+
+
+@dataclass(**_DATACLASS_SLOTS)
 class GffLine:
 
     """Named tuple which gives a GFF-formatted line when printed.
@@ -240,10 +309,14 @@ class GffLine:
     columns : GffColumns
         Representation of columns 1-8.
     attributes : dict
-        Dictionary mapping attribute keys to values.
+        Dictionary mapping attribute keys to values. Can be instantiated 
+        with the GFF-formatted attribute string, which is only parsed when 
+        `attributes` is first accessed.
 
     Methods
     -------
+    attribute_items()
+        Iterate over attribute key, value pairs.
     copy()
         Make a copy.
     __str__()
@@ -258,43 +331,108 @@ class GffLine:
     ...                    attributes={"ID": "test01", "attr1": "+"})  
     >>> print(gff_line)  # doctest: +NORMALIZE_WHITESPACE
     test_seq        test_source     gene    1       10      .       +       .       ID=test01;attr1=+
+    >>> gff_line = GffLine(columns, attributes="ID=test01;attr1=+")
+    >>> gff_line.attributes
+    {'ID': 'test01', 'attr1': '+'}
+
+    Repeated attribute keys keep the last value, whether or not
+    `attributes` has been accessed.
+
+    >>> gff_line = GffLine(columns, attributes="ID=a;Name=x;ID=b")
+    >>> print(gff_line)  # doctest: +NORMALIZE_WHITESPACE
+    test_seq        test_source     gene    1       10      .       +       .       ID=b;Name=x
+    >>> list(gff_line.attribute_items())
+    [('ID', 'b'), ('Name', 'x')]
+    >>> gff_line.attributes
+    {'ID': 'b', 'Name': 'x'}
+    >>> print(gff_line)  # doctest: +NORMALIZE_WHITESPACE
+    test_seq        test_source     gene    1       10      .       +       .       ID=b;Name=x
 
     """
 
-    columns : Union[GffColumns, Iterable]
-    attributes : Optional[dict] = field(default_factory=dict)
+    columns : Union[GffColumns, tuple, list]
+    attributes : InitVar[Optional[Union[dict, str]]] = None
+    _attributes : Union[dict, str] = field(init=False, repr=False, compare=False)
 
     @staticmethod
     def _get_gff_attributes(x: str) -> Dict[str, str]:
 
-        splits_on_equal_sign = [item.split(';') for item in x.split('=')]
-        
-        attributes = (item[-1] for item in splits_on_equal_sign)
-        values = (item[0] for item in splits_on_equal_sign[1:])
-        
-        return dict(zip(attributes, values))
+        return dict(_ATTR_RE.findall(x))
     
 
-    def __post_init__(self):
+    def __post_init__(self, 
+                      attributes: Optional[Union[dict, str]]):
 
-        if isinstance(self.columns, Iterable):
+        if isinstance(self.columns, (tuple, list)):
 
             self.columns = GffColumns(*self.columns)
 
-        if isinstance(self.attributes, str):
+        # strings are only parsed when `attributes` is first accessed
+        self._attributes = {} if attributes is None else attributes
+
+
+    def __eq__(self, other) -> bool:
 
-            self.attributes = self._get_gff_attributes(self.attributes)
+        if other.__class__ is not self.__class__:
+
+            return NotImplemented
+
+        return (self.columns, self.attributes) == (other.columns, other.attributes)
+
+
+    def __repr__(self) -> str:
+
+        return f'{self.__class__.__name__}(columns={self.columns!r}, attributes={self.attributes!r})'
 
     
     def __str__(self) -> str:
 
         """Show the GFF-formatted line."""
 
-        _attributes = ';'.join(f'{key}={val}' for key, val in self.attributes.items())
+        if (isinstance(self._attributes, str) and 
+            _ATTR_STRING_RE.fullmatch(self._attributes) and 
+            not _has_repeated_keys(self._attributes)):
+
+            # unparsed and already in the form it would be written
+            _attributes = self._attributes
+
+        else:
+            
+            _attributes = ';'.join(f'{key}={val}' for key, val in self.attribute_items())
 
         return str(self.columns) + '\t' + _attributes
     
 
+    def attribute_items(self) -> Iterable[Tuple[str, str]]:
+
+        """Iterate over attribute key, value pairs.
+        
+        If the attributes have not been parsed yet, they are read directly
+        from the GFF-formatted string without building a dictionary.
+
+        """
+
+        if isinstance(self._attributes, str):
+
+            items = _ATTR_RE.findall(self._attributes)
+
+            if len(set(key for key, _ in items)) < len(items):
+                # last value wins, as when parsed into a dictionary
+                return dict(items).items()
+
+            return items
+        
+        else:
+
+            return self._attributes.items()
+
+
+    def __reduce__(self):
+
+        # keep unparsed attributes as a string when pickling
+        return self.__class__, (self.columns, self._attributes)
+    
+
     def as_dict(self) -> dict:
 
         """Convert to dictionary."""
@@ -309,7 +447,7 @@ class GffLine:
 
         """Make a copy."""
 
-        return replace(self)
+        return self.__class__(self.columns, self._attributes)
     
 
     def write(self, 
@@ -354,17 +492,291 @@ class GffLine:
 
         """
 
-        _fields = _GFF_COLNAMES #[f.name for f in fields(cls)]
-
         columns = GffColumns(**{key: value for key, value in d.items() 
-                                if key in _fields})
+                                if key in _GFF_COL_FIELD_NAME_SET})
         attributes = {key: d[key] for key in sorted(d) 
-                      if key not in _fields}
+                      if key not in _GFF_COL_FIELD_NAME_SET}
 
         return GffLine(columns, attributes)
     
 
-@dataclass
+def _get_attributes(self: GffLine) -> dict:
+
+    if isinstance(self._attributes, str):
+
+        self._attributes = self._get_gff_attributes(self._attributes)
+
+    return self._attributes
+
+
+def _set_attributes(self: GffLine, 
+                    value: Union[dict, str]) -> None:
+
+    self._attributes = value
+
+
+# Replaces the class attribute holding the `attributes` default, after the 
+# dataclass is built, so that it isn't taken as the default itself
+GffLine.attributes = property(_get_attributes, _set_attributes)
+
+
+class _LookupSpan(NamedTuple):
+
+    start: int
+    stop: int
+    feature_idx: int
+    offset_start: int
+    sign: int
+    prefix_idx: int = 0
+    overwrite: bool = False
+
+
+def _fill_offsets_numpy(start: int,
+                        offset_start: int,
+                        sign: int,
+                        out_offsets: np.ndarray) -> None:
+
+    """Fill offsets of each location from a feature, in place.
+
+    Gives the same result as `_fill_offsets_loop`, which is compiled 
+    with Numba when it is installed.
+
+    Examples
+    --------
+    >>> offsets = np.zeros(5, dtype=np.int32)
+    >>> _fill_offsets_numpy(5, 8, -1, offsets)
+    >>> offsets
+    array([ 3,  2,  1,  0, -1], dtype=int32)
+    >>> for fill_offsets in (_fill_offsets_loop, _fill_offsets):
+    ...     loop_offsets = np.zeros(5, dtype=np.int32)
+    ...     fill_offsets(5, 8, -1, loop_offsets)
+    ...     print(np.array_equal(offsets, loop_offsets))
+    True
+    True
+
+    """
+
+    np.multiply(np.arange(start - offset_start, start - offset_start + out_offsets.size), 
+                sign, 
+                out=out_offsets)
+
+    return None
+
+
+def _fill_offsets_loop(start: int,
+                       offset_start: int,
+                       sign: int,
+                       out_offsets: np.ndarray) -> None:
+
+    for i in range(out_offsets.size):
+
+        out_offsets[i] = (start + i - offset_start) * sign
+
+    return None
+
+
+_fill_offsets = (njit(cache=True)(_fill_offsets_loop) if _NUMBA_AVAILABLE 
+                 else _fill_offsets_numpy)
+
+
+@dataclass(eq=False, **_DATACLASS_SLOTS)
+class GffLookupTable(MappingABC):
+
+    """Lookup table mapping chromosome location to feature annotations.
+
+    The first annotation at each location is stored in dense arrays 
+    indexed by location, and any overlapping annotations in a sparse 
+    dictionary. `GffLine`s are only built when a location is looked up.
+    Behaves as a read-only mapping of location to a tuple of `GffLine`s, 
+    so it has the usual `get()`, `keys()`, `values()` and `items()`.
+
+    Attributes
+    ----------
+    features : tuple of GffLine
+        Features referenced by the table.
+    feature_idx : np.ndarray
+        Index into `features` for each location, or -1 if there is no 
+        annotation.
+    offsets : np.ndarray
+        Offset of each location relative to its feature.
+    prefix_idx : np.ndarray
+        Index into ('', '_up-', '_down-') for each location. Non-zero entries 
+        have `locus_tag` replaced by the prefix and the feature `Name`.
+    overlaps : dict, optional
+        Dictionary mapping locations to a list of `(feature_idx, offset, prefix_idx)`
+        for additional annotations.
+
+    Methods
+    -------
+    __getitem__()
+        Get annotations for a chromosome location.
+    get(), keys(), values(), items()
+        As for `dict`.
+
+    Examples
+    --------
+    >>> import numpy as np
+    >>> feature = GffLine(["test_seq", "test_source", "gene", 3, 4], 
+    ...                   attributes={"Name": "test01"})
+    >>> lookup = GffLookupTable((feature, ), 
+    ...                         feature_idx=np.array([-1, 0, 0, 0, 0]),
+    ...                         offsets=np.array([0, 2, 1, 0, 1]),
+    ...                         prefix_idx=np.array([0, 1, 1, 0, 0]))
+    >>> for line in lookup[2]:
+    ...     print(line)  # doctest: +NORMALIZE_WHITESPACE
+    test_seq        test_source     gene    3       4       .       +       .       Name=test01;locus_tag=_up-test01;offset=1
+    >>> 4 in lookup, 5 in lookup
+    (True, False)
+    >>> list(lookup.keys()), lookup.get(5)
+    ([1, 2, 3, 4], None)
+
+    """
+
+    features: Tuple[GffLine]
+    feature_idx: np.ndarray = field(repr=False)
+    offsets: np.ndarray = field(repr=False)
+    prefix_idx: np.ndarray = field(repr=False)
+    overlaps: Dict[int, List[Tuple[int, int, int]]] = field(default_factory=dict, repr=False)
+
+    def _entry(self, 
+               feature_idx: int, 
+               offset: int, 
+               prefix_idx: int) -> GffLine:
+
+        feature = self.features[feature_idx]
+        attributes = feature.attributes.copy()
+        prefix = _LOCUS_TAG_PREFIXES[prefix_idx]
+
+        if len(prefix) > 0:
+
+            attributes['locus_tag'] = prefix + attributes['Name']
+
+        attributes['offset'] = int(offset)
+
+        return replace(feature, attributes=attributes)
+
+
+    def __getitem__(self, position: int) -> Tuple[GffLine]:
+
+        """Get annotations for a chromosome location."""
+
+        if position not in self:
+
+            raise KeyError(position)
+        
+        entries = chain([(self.feature_idx[position], 
+                          self.offsets[position], 
+                          self.prefix_idx[position])],
+                        self.overlaps.get(position, []))
+
+        return tuple(self._entry(*entry) for entry in entries)
+    
+
+    def __contains__(self, position: int) -> bool:
+
+        return 0 <= position < self.feature_idx.size and self.feature_idx[position] >= 0
+    
+
+    def __iter__(self) -> Iterable[int]:
+
+        return (int(position) for position in np.flatnonzero(self.feature_idx >= 0))
+    
+
+    def __len__(self) -> int:
+
+        return int(np.count_nonzero(self.feature_idx >= 0))
+
+
+    @classmethod
+    def from_spans(cls, 
+                   features: Iterable[GffLine], 
+                   spans: Iterable[_LookupSpan],
+                   size: Optional[int] = None):
+
+        """Build a lookup table from spans of locations.
+
+        Spans are applied in order. Locations already annotated by an 
+        earlier span keep both annotations, unless a later span has 
+        `overwrite=True`, which replaces all of them.
+
+        Examples
+        --------
+        >>> genes = (GffLine(["seq", "src", "gene", 2, 6], attributes={"Name": "geneA"}),
+        ...          GffLine(["seq", "src", "gene", 4, 8], attributes={"Name": "geneB"}))
+        >>> spans = [_LookupSpan(2, 7, feature_idx=0, offset_start=2, sign=1), 
+        ...          _LookupSpan(4, 9, feature_idx=1, offset_start=4, sign=1),
+        ...          _LookupSpan(6, 7, feature_idx=1, offset_start=4, sign=1, 
+        ...                      prefix_idx=1, overwrite=True)]
+        >>> lookup = GffLookupTable.from_spans(genes, spans)
+        >>> [line.attributes for line in lookup[4]]
+        [{'Name': 'geneA', 'offset': 2}, {'Name': 'geneB', 'offset': 0}]
+        >>> [line.attributes for line in lookup[6]]
+        [{'Name': 'geneB', 'locus_tag': '_up-geneB', 'offset': 2}]
+
+        """
+
+        if size is None:
+
+            spans = list(spans)
+            size = max(span.stop for span in spans)
+
+        feature_idx = np.full(size, -1, dtype=np.int32)
+        offsets = np.zeros(size, dtype=np.int32)
+        prefix_idx = np.zeros(size, dtype=np.int8)
+        last_overwrite = np.full(size, -1, dtype=np.int32)
+        extra = []
+
+        for i, span in enumerate(spans):
+
+            lo, hi = span.start, span.stop
+
+            if hi <= lo:
+
+                continue
+
+            if span.overwrite:
+
+                feature_idx[lo:hi] = span.feature_idx
+                _fill_offsets(lo, span.offset_start, span.sign, offsets[lo:hi])
+                prefix_idx[lo:hi] = span.prefix_idx
+                last_overwrite[lo:hi] = i
+
+            else:
+
+                span_offsets = np.empty(hi - lo, dtype=np.int32)
+                _fill_offsets(lo, span.offset_start, span.sign, span_offsets)
+                is_free = feature_idx[lo:hi] < 0
+                feature_idx[lo:hi][is_free] = span.feature_idx
+                offsets[lo:hi][is_free] = span_offsets[is_free]
+                prefix_idx[lo:hi][is_free] = span.prefix_idx
+
+                if not np.all(is_free):
+
+                    is_taken = ~is_free
+                    extra.append((i, span, 
+                                  np.flatnonzero(is_taken) + lo, 
+                                  span_offsets[is_taken]))
+
+        overlaps = defaultdict(list)
+
+        for i, span, positions, span_offsets in extra:
+            
+            # later overwriting spans remove any overlaps at those locations
+            is_kept = last_overwrite[positions] <= i
+
+            for position, offset in zip(positions[is_kept].tolist(),
+                                        span_offsets[is_kept].tolist()):
+
+                overlaps[position].append((span.feature_idx, offset, span.prefix_idx))
+
+        return cls(features=tuple(features),
+                   feature_idx=feature_idx,
+                   offsets=offsets,
+                   prefix_idx=prefix_idx,
+                   overlaps=dict(overlaps))
+
+
+@dataclass(**_DATACLASS_SLOTS)
 class GffFile:
 
     r"""Object for reading, writing, and manipulating GFF files.
@@ -385,6 +797,8 @@ class GffFile:
         Produce an iterator of dictionaries.
     from_file()
         Read a GFF file.
+    lookup_at()
+        Get feature annotations at a chromosome location.
     write()
         Write to a file.
 
@@ -411,11 +825,13 @@ class GffFile:
     lines: Iterable[GffLine]
     metadata: Optional[Union[GffMetadata, Iterable[Union[Iterable, GffMetadatum]]]] = field(default_factory=list)
     lookup: Optional[bool] = field(default=False)
-    _lookup: Dict[int, Tuple[GffLine]] = field(init=False, default_factory=dict)
+    _lookup: Optional[GffLookupTable] = field(init=False, default=None, repr=False)
+    _table: Optional[DataFrame] = field(init=False, default=None, repr=False, compare=False)
+    _table_lines: Optional[Iterable[GffLine]] = field(init=False, default=None, repr=False, compare=False)
 
     def __post_init__(self):
 
-        if isinstance(self.metadata, Iterable):
+        if not isinstance(self.metadata, GffMetadata):
 
             self.metadata = GffMetadata(self.metadata)
 
@@ -426,80 +842,107 @@ class GffFile:
 
     @staticmethod
     def _gapfill_table(gff_line: GffLine, 
-                       last_feature: Optional[GffLine] = None) -> Dict[int, GffLine]:
-
-        lookup_table = defaultdict(list)
+                       last_feature: Optional[GffLine] = None,
+                       feature_idx: int = 0) -> Tuple[_LookupSpan, _LookupSpan]:
 
         this_start = gff_line.columns.start
 
         if last_feature is None:
 
             last_end = 0
-            intergenic0 = gff_line.copy()
+            intergenic0, intergenic0_idx = gff_line, feature_idx
         
         else:
 
             last_end = last_feature.columns.end
-            intergenic0 = last_feature.copy()
+            intergenic0, intergenic0_idx = last_feature, feature_idx - 1
 
-        intergenic1 = gff_line.copy()
+        intergenic1 = gff_line
 
         gap_span = (this_start - 1) - (last_end + 1)
         gap_midpoint = last_end + 1 + gap_span // 2
         
         if intergenic0.columns.strand == '+':
             pre_mid_offset_start = intergenic0.columns.start
-            pre_mid_sign = 1.
+            pre_mid_sign = 1
             pre_mid_prefix = '_down-' if last_feature is not None else '_up-' 
         else:
             pre_mid_offset_start = intergenic0.columns.end
-            pre_mid_sign = -1.
+            pre_mid_sign = -1
             pre_mid_prefix = '_up-' if last_feature is not None else '_down-' 
 
         if intergenic1.columns.strand == '+':
             post_mid_offset_start = intergenic1.columns.start
-            post_mid_sign = -1.
+            post_mid_sign = -1
             post_mid_prefix = '_up-'
         else:
             post_mid_offset_start = intergenic1.columns.end
-            post_mid_sign = 1.
+            post_mid_sign = 1
             post_mid_prefix = '_down-'
 
-        attr0 = intergenic0.attributes.copy() 
-        attr0.update(dict(locus_tag=pre_mid_prefix + attr0['Name']))
-        attr1 = intergenic1.attributes.copy() 
-        attr1.update(dict(locus_tag=post_mid_prefix + attr1['Name']))
-        # print(attr1)
-
         # fill in the gap
-        for i in range(last_end + 1, gap_midpoint + 1):
+        pre_mid = _LookupSpan(last_end + 1, gap_midpoint + 1, 
+                              feature_idx=intergenic0_idx,
+                              offset_start=pre_mid_offset_start,
+                              sign=pre_mid_sign,
+                              prefix_idx=_LOCUS_TAG_PREFIXES.index(pre_mid_prefix),
+                              overwrite=True)
+        post_mid = _LookupSpan(gap_midpoint + 1, this_start, 
+                               feature_idx=feature_idx,
+                               offset_start=post_mid_offset_start,
+                               sign=post_mid_sign,
+                               prefix_idx=_LOCUS_TAG_PREFIXES.index(post_mid_prefix),
+                               overwrite=True)
+
+        return pre_mid, post_mid
 
-            offset = (i - pre_mid_offset_start) * pre_mid_sign
-            this_attr0 = attr0.copy()
-            this_attr0.update(dict(offset=int(offset)))
-            this_intergenic = replace(intergenic0, 
-                                      attributes=this_attr0)
 
-            lookup_table[i].append(this_intergenic)
+    @staticmethod
+    def _lookup_spans(features: Iterable[GffLine]) -> Iterable[_LookupSpan]:
 
-        for i in range(gap_midpoint + 1, this_start):
+        last_feature = None 
 
-            offset = (i - post_mid_offset_start) * post_mid_sign
-            this_attr1 = attr1.copy()
-            this_attr1.update(dict(offset=int(offset)))
-            this_intergenic = replace(intergenic1, 
-                                      attributes=this_attr1)
+        for feature_idx, gff_line in enumerate(features):
 
-            lookup_table[i].append(this_intergenic)
+            yield from GffFile._gapfill_table(gff_line, 
+                                              last_feature,
+                                              feature_idx=feature_idx)
 
-        return lookup_table
+            if gff_line.columns.strand == '+':
+                offset_start, sign = gff_line.columns.start, 1
+            else:
+                offset_start, sign = gff_line.columns.end, -1
 
+            yield _LookupSpan(gff_line.columns.start, 
+                              gff_line.columns.end + 1,
+                              feature_idx=feature_idx,
+                              offset_start=offset_start,
+                              sign=sign)
 
-    def _lookup_table(self) -> Dict[int, GffLine]:
+            last_feature = gff_line
+
+        if last_feature.columns.strand == '+':
+            last_offset_start = last_feature.columns.start
+            last_sign = 1
+            last_prefix = '_down-'
+        else:
+            last_offset_start = last_feature.columns.end
+            last_sign = -1
+            last_prefix = '_up-'
+
+        yield _LookupSpan(last_feature.columns.end, 
+                          last_feature.columns.end + 1000,
+                          feature_idx=feature_idx,
+                          offset_start=last_offset_start,
+                          sign=last_sign,
+                          prefix_idx=_LOCUS_TAG_PREFIXES.index(last_prefix))
+
+
+    def _lookup_table(self) -> GffLookupTable:
 
         """Generate a lookup table for parent features in GFF.
 
-        Results in a dictionary allowing lookup by chromosome location 
+        Results in a table allowing lookup by chromosome location 
         to return feature annotations. Regions without annotation
         are automatically filled with references to upstream or 
         downstream features.
@@ -513,72 +956,87 @@ class GffFile:
 
         Returns
         -------
-        dict
-            Dictionary mapping chromosome location to feature annotation.
+        GffLookupTable
+            Read-only mapping of chromosome location to feature annotation. 
+            This is no longer a `dict`; use `dict(...)` if one is needed.
 
-        """.format(', '.join(_GFF_FEATURE_BLOCKLIST))
+        """.format(', '.join(sorted(_GFF_FEATURE_BLOCKLIST)))
 
         print_err("Building annotation lookup table.")
 
-        lookup_table = defaultdict(list)
+        features = [gff_line for gff_line in tqdm(self.lines)
+                    if (gff_line.columns.feature not in _GFF_FEATURE_BLOCKLIST and 
+                        'Name' in gff_line.attributes and
+                        'Parent' not in gff_line.attributes)]
 
-        last_feature = None 
+        if len(features) == 0:
 
-        for gff_line in tqdm(self.lines):
+            raise ValueError("No parent features to build lookup table from.")
 
-            if (gff_line.columns.feature not in _GFF_FEATURE_BLOCKLIST and 
-                'Name' in gff_line.attributes and
-                'Parent' not in gff_line.attributes):
-                    
-                gap_table = self._gapfill_table(gff_line, 
-                                                last_feature)
-                
-                lookup_table.update(gap_table)
+        # allocate once, including the 1000 locations after the last feature
+        size = max(max(feature.columns.end for feature in features), 
+                   features[-1].columns.end + 999) + 1
+        lookup_table = GffLookupTable.from_spans(features, 
+                                                 self._lookup_spans(features), 
+                                                 size=size)
 
-                offset_start = (gff_line.columns.start 
-                                if gff_line.columns.strand == '+' 
-                                else gff_line.columns.end)
+        missing_entries = np.flatnonzero(lookup_table.feature_idx[1:] < 0) + 1
 
-                for i in range(gff_line.columns.start, 
-                               gff_line.columns.end + 1):
+        if missing_entries.size > 0:
 
-                    offset =  abs(i - offset_start)
-                    this_gff_line = gff_line.copy()
-                    this_gff_line.attributes['offset'] = offset
+            raise AttributeError("Chromosome locations {} are missing from lookup table."
+                                 .format(', '.join(map(str, missing_entries))))
 
-                    lookup_table[i].append(this_gff_line)
+        return lookup_table
 
-                last_feature = gff_line.copy()
 
-        if last_feature.columns.strand == '+':
-            last_offset_start = last_feature.columns.start
-            last_sign = 1.
-            last_prefix = '_down-'
-        else:
-            last_offset_start = last_feature.columns.end
-            last_sign = -1.
-            last_prefix = '_up-'
+    def lookup_at(self, position: int) -> Tuple[GffLine]:
+
+        r"""Get feature annotations at a chromosome location.
 
-        attr = last_feature.attributes.copy()
-        attr.update(dict(locus_tag=last_prefix + attr['Name']))
+        Builds the lookup table first if it has not been built yet. Only
+        the annotations at `position` are converted to `GffLine`s.
 
-        for i in range(last_feature.columns.end, 
-                       last_feature.columns.end + 1000):
+        Parameters
+        ----------
+        position : int
+            Chromosome location.
 
-            offset = (i - last_offset_start) * last_sign
-            new_attributes = attr.copy() 
-            new_attributes.update(dict(offset=int(offset)))
-            last_feature = replace(last_feature, attributes=new_attributes)
+        Returns
+        -------
+        tuple of GffLine
+            Annotations at `position`, with `offset` and `locus_tag` 
+            attributes relative to the nearest feature.
 
-            lookup_table[i].append(last_feature)
+        Raises
+        ------
+        KeyError
+            If `position` is not in the lookup table.
 
-        missing_entries = [i for i in range(1, max(lookup_table) + 1) if len(lookup_table[i]) == 0]
+        Examples
+        --------
+        >>> from io import StringIO
+        >>> file = StringIO()
+        >>> lines = ["TEST    test    gene    3   5   .   +   .   ID=g1;Name=geneA".split(),
+        ...          "TEST    test    gene    10  12  .   -   .   ID=g2;Name=geneB".split()]
+        >>> for line in lines:
+        ...     print('\t'.join(line), file=file)
+        >>> gff = GffFile.from_file(file, lookup=True)
+        >>> for position in (4, 7, 8):
+        ...     for line in gff.lookup_at(position):
+        ...         print(line)  # doctest: +NORMALIZE_WHITESPACE
+        TEST    test    gene    3       5       .       +       .       ID=g1;Name=geneA;offset=1
+        TEST    test    gene    3       5       .       +       .       ID=g1;Name=geneA;locus_tag=_down-geneA;offset=4
+        TEST    test    gene    10      12      .       -       .       ID=g2;Name=geneB;locus_tag=_down-geneB;offset=-4
 
-        if len(missing_entries) > 0:
+        """
+
+        if self._lookup is None:
 
-            raise AttributeError(f"Chromosome locations {', '.join(missing_entries)} are missing from lookup table.")
+            self.lines = tuple(self.lines)
+            self._lookup = self._lookup_table()
 
-        return {key: tuple(value) for key, value in lookup_table.items()}
+        return self._lookup[position]
 
 
     def as_dict(self) -> Iterable[dict]:
@@ -671,40 +1129,88 @@ class GffFile:
 
         """
 
-        self.lines = tuple(self.lines)
-        attribute_keys = set()
-        main_cols = None
+        # only valid while `lines` hasn't been replaced
+        if self._table is not None and self.lines is self._table_lines:
+
+            return self._table_to_csv(file=file, 
+                                      write_metadata=write_metadata,
+                                      sep=sep)
+
+        lines, attribute_keys = [], set()
 
         print_err('Processing GFF attributes...')
-        for i, gff_line in enumerate(tqdm(self.lines)):
+        for gff_line in tqdm(self.lines):
 
-            if i == 0:
-                
-                main_cols = [f.name for f in fields(gff_line.columns)]
-            
-            attribute_keys |= set(gff_line.attributes)
+            attribute_keys.update(gff_line.attributes)
+            lines.append(gff_line)
+
+        self.lines = tuple(lines)
 
-        if main_cols is None:
+        if len(self.lines) == 0:
 
             raise IOError('GFF stream is empty.')
 
+        main_cols = list(_GFF_COL_FIELD_NAMES)
+
         if write_metadata:
             
             self.metadata.write(file=file)
 
-        csv_fieldnames = list(chain(main_cols, sorted(attribute_keys)))
-        writer = csv.DictWriter(file,
-                                fieldnames=csv_fieldnames,
-                                delimiter=sep)
-        writer.writeheader()
-        
-        for gff_line in self.as_dict():
+        attribute_keys = sorted(attribute_keys)
+        csv_fieldnames = list(chain(main_cols, attribute_keys))
+        # missing attributes are None, which csv writes as empty fields
+        rows = (gff_line.columns.as_tuple() + tuple(gff_line.attributes.get(key) 
+                                                    for key in attribute_keys)
+                for gff_line in self.lines)
+        writer = csv.writer(file, 
+                            delimiter=sep, 
+                            lineterminator='\n')
+        writer.writerow(csv_fieldnames)
+        writer.writerows(rows)
 
-            writer.writerow(gff_line)
+        return None
+
+
+    def _table_to_csv(self,
+                      file: TextIOWrapper = sys.stdout,
+                      write_metadata: bool = False,
+                      sep=',') -> None:
+
+        if self._table.shape[0] == 0:
+
+            raise IOError('GFF stream is empty.')
+
+        print_err('Processing GFF attributes...')
+        attributes = DataFrame.from_records(self._table['attribute'].map(GffLine._get_gff_attributes).tolist(),
+                                            index=self._table.index)
+        table = concat([self._table.drop(columns='attribute'), 
+                        attributes[sorted(attributes.columns)]], 
+                       axis=1)
+
+        if write_metadata:
+            
+            self.metadata.write(file=file)
+
+        table.to_csv(file, 
+                     sep=sep, 
+                     index=False, 
+                     na_rep='',
+                     lineterminator='\n')
 
         return None
 
 
+    @staticmethod
+    def _parse_metadatum(line: str) -> GffMetadatum:
+
+        flag = 'constrained' if line.startswith('##') else 'free'
+        this_metadata = line.lstrip('#').lstrip().split('\t')
+
+        return GffMetadatum(name=this_metadata[0], 
+                            flag=flag, 
+                            values=this_metadata[1:])
+
+
     @staticmethod
     def _from_file(file: Union[str, TextIOWrapper]) -> Iterable[Union[GffMetadata, GffLine]]:
 
@@ -719,12 +1225,7 @@ class GffFile:
 
                 if line.startswith('#'):  # header
 
-                    flag = 'constrained' if line.startswith('##') else 'free'
-                    this_metadata = line.lstrip('#').lstrip().split('\t')
-                    
-                    metadata.append(GffMetadatum(name=this_metadata[0], 
-                                                 flag=flag, 
-                                                 values=this_metadata[1:]))
+                    metadata.append(GffFile._parse_metadatum(line))
 
                 elif len(line) > 0:  ## tab-delimited table
                     
@@ -733,7 +1234,9 @@ class GffFile:
 
                     metadata_shown = True
 
-                    data = line.split('\t')  ## Must be TAB otherwise columns 1-8 get messed up
+                    data = line.split('\t', 8)  ## Must be TAB otherwise columns 1-8 get messed up
+                    data[:3] = map(sys.intern, data[:3])  # share repeated seqid, source, feature
+                    data[5:8] = map(sys.intern, data[5:8])  # and score, strand, phase
                     
                     try:
                         
@@ -747,8 +1250,7 @@ class GffFile:
                                       'Here\'s the last line read:\n\n'
                                       f'{line}\n\n')
                     
-                    attributes = '\t'.join(data[8:]) 
-
+                    attributes = data[8] if len(data) > 8 else {}
                     yield GffLine(columns, attributes)
 
 
@@ -792,6 +1294,332 @@ class GffFile:
         return cls(lines=(line for line in file_parser), 
                    metadata=metadata,
                    lookup=lookup)
+
+
+    @classmethod
+    def from_file_parallel(cls, 
+                           file: str,
+                           lookup: bool = False,
+                           n_workers: Optional[int] = None):
+
+        r"""Read records from a GFF file using several processes.
+
+        The body of the file after the header is split into byte ranges 
+        which end on a newline, and each range is read into a table by a 
+        separate worker process, as in `from_file_fast()`. The tables 
+        are joined in the main process, so like `from_file_fast()`, the 
+        whole file is read into memory. With one worker, this is the 
+        same as `from_file()`.
+
+        Parameters
+        ----------
+        file: str
+            Path to a GFF file.
+        lookup: bool, optional
+            Whether to create lookup table. Default: False.
+        n_workers: int, optional
+            Number of worker processes. Default: number of CPUs.
+
+        Returns
+        -------
+        GffFile
+
+        Examples
+        --------
+        >>> from tempfile import NamedTemporaryFile
+        >>> with NamedTemporaryFile('w', suffix='.gff3', delete=False) as file:
+        ...     print("##meta1\titem1", file=file)
+        ...     print('\t'.join('TEST    test    gene    1       100     .       +       +       ID=test001;comment=Test'.split()), 
+        ...           file=file)
+        ...     print('\t'.join('TEST    test    gene    121       120     .       +       -       ID=test001;tag=test_tag'.split()), 
+        ...           file=file)
+        >>> GffFile.from_file_parallel(file.name, n_workers=2).write()  # doctest: +NORMALIZE_WHITESPACE
+        ##meta1 item1
+        TEST    test    gene    1       100     .       +       +       ID=test001;comment=Test
+        TEST    test    gene    121     120     .       +       -       ID=test001;tag=test_tag
+        >>> os.remove(file.name)
+
+        """
+
+        n_workers = os.cpu_count() if n_workers is None else n_workers
+
+        if n_workers <= 1:
+
+            return cls.from_file(file, lookup=lookup)
+
+        metadata = []
+
+        with open(file, 'rb') as f:
+
+            size = os.fstat(f.fileno()).st_size
+            position = f.tell()
+            line = f.readline()
+
+            while line.startswith(b'#'):
+
+                metadata.append(cls._parse_metadatum(line.decode().strip()))
+                position = f.tell()
+                line = f.readline()
+
+            # move each boundary forward to the start of the next line
+            boundaries = [position]
+
+            for i in range(1, n_workers):
+
+                boundary = position + (size - position) * i // n_workers
+
+                if boundary > boundaries[-1]:
+
+                    f.seek(boundary - 1)
+                    f.readline()
+                    boundaries.append(f.tell())
+
+        boundaries.append(size)
+        byte_ranges = [(start, end) for start, end in zip(boundaries[:-1], boundaries[1:]) 
+                       if end > start]
+
+        if len(byte_ranges) > 0:
+
+            starts, ends = zip(*byte_ranges)
+
+            # tables pickle as a few buffers, unlike many GffLines
+            with ProcessPoolExecutor(min(n_workers, len(byte_ranges))) as executor:
+
+                table = concat(executor.map(_parse_byte_range, 
+                                            [file] * len(starts), 
+                                            starts, 
+                                            ends), 
+                               ignore_index=True)
+
+        else:
+
+            table = cls._clean_table(DataFrame(columns=_GFF_COLNAMES))
+
+        return cls._from_table(table, metadata=metadata, lookup=lookup)
+
+
+    @staticmethod
+    def _lines_from_table(table: DataFrame) -> Iterable[GffLine]:
+
+        for row in table.itertuples(index=False, name=None):
+
+            yield GffLine(row[:8], row[8])
+
+
+    @staticmethod
+    def _read_table_c(file: Union[TextIOWrapper, BytesIO]) -> DataFrame:
+
+        return read_csv(file, 
+                        sep='\t', 
+                        header=None, 
+                        names=_GFF_COLNAMES,
+                        dtype=str,
+                        engine='c',
+                        na_filter=False,
+                        quoting=csv.QUOTE_NONE)
+
+
+    @staticmethod
+    def _clean_table(table: DataFrame) -> DataFrame:
+
+        # comments and directives like "###" can appear after the header
+        return (table[~table['seqid'].str.startswith('#')]
+                .astype({'start': int, 'end': int}))
+
+
+    @classmethod
+    def _from_table(cls, 
+                    table: DataFrame,
+                    metadata: Iterable[GffMetadatum],
+                    lookup: bool = False):
+
+        gff_file = cls(lines=cls._lines_from_table(table), 
+                       metadata=metadata,
+                       lookup=lookup)
+        gff_file._table, gff_file._table_lines = table, gff_file.lines
+
+        return gff_file
+
+
+    @staticmethod
+    def _read_table_arrow(filename: str, 
+                          skip_rows: int = 0) -> DataFrame:
+
+        read_options = pacsv.ReadOptions(column_names=_GFF_COLNAMES, 
+                                         skip_rows=skip_rows,
+                                         block_size=1 << 20)
+        parse_options = pacsv.ParseOptions(delimiter='\t', 
+                                           quote_char=False,
+                                           invalid_row_handler=_skip_comment_row)
+        convert_options = pacsv.ConvertOptions(column_types={name: pa.string() 
+                                                             for name in _GFF_COLNAMES},
+                                               strings_can_be_null=False)
+
+        return pacsv.read_csv(filename, 
+                              read_options=read_options,
+                              parse_options=parse_options,
+                              convert_options=convert_options).to_pandas()
+
+
+    @classmethod
+    def from_file_fast(cls, 
+                       file: Union[str, TextIOWrapper],
+                       lookup: bool = False,
+                       engine: Optional[str] = None):
+
+        r"""Read records from a GFF file in one pass of a compiled parser.
+
+        Unlike `from_file()`, the whole file is read into memory as a
+        `pandas.DataFrame`. `GffLine`s are only created when `lines` is 
+        iterated, and `to_csv()` works directly from the table. Falls 
+        back to `from_file()` for streams which can't be rewound, such 
+        as `sys.stdin`.
+
+        Parameters
+        ----------
+        file: TextIO
+            File handle such as on generated by `open(f, mode='r')`.
+        lookup: bool, optional
+            Whether to create lookup table. Default: False.
+        engine: str, optional
+            Either 'c' for the Pandas C parser, or 'pyarrow' for the 
+            multithreaded PyArrow CSV reader, which needs PyArrow installed 
+            and a named file on disk. Default: 'pyarrow' if possible, 
+            otherwise 'c'.
+
+        Returns
+        -------
+        GffFile
+
+        Examples
+        --------
+        >>> from io import StringIO
+        >>> file = StringIO()
+        >>> print("##meta1\titem1", file=file)
+        >>> print('\t'.join('TEST    test    gene    1       100     .       +       +       ID=test001;comment=Test'.split()), 
+        ...       file=file)
+        >>> print('\t'.join('TEST    test    gene    121       120     .       +       -       ID=test001;tag=test_tag'.split()), 
+        ...       file=file)
+        >>> gff = GffFile.from_file_fast(file)
+        >>> output = StringIO()
+        >>> gff.to_csv(output, write_metadata=True)
+        >>> output.seek(0)
+        0
+        >>> print("".join(output))  # doctest: +NORMALIZE_WHITESPACE
+        ##meta1 item1
+        seqid,source,feature,start,end,score,strand,phase,ID,comment,tag
+        TEST,test,gene,1,100,.,+,+,test001,Test,
+        TEST,test,gene,121,120,.,+,-,test001,,test_tag
+        <BLANKLINE>
+        >>> gff.write()  # doctest: +NORMALIZE_WHITESPACE
+        ##meta1 item1
+        TEST    test    gene    1       100     .       +       +       ID=test001;comment=Test
+        TEST    test    gene    121     120     .       +       -       ID=test001;tag=test_tag
+
+        Replacing `lines` means they are used instead of the table.
+
+        >>> file = StringIO()
+        >>> print('\t'.join('TEST    test    gene    1       100     .       +       +       ID=test001;comment=Test'.split()), 
+        ...       file=file)
+        >>> print('\t'.join('TEST    test    gene    121       120     .       +       -       ID=test001;tag=test_tag'.split()), 
+        ...       file=file)
+        >>> gff = GffFile.from_file_fast(file)
+        >>> gff.lines = [line for line in gff.lines if line.columns.start > 100]
+        >>> output = StringIO()
+        >>> gff.to_csv(output)
+        >>> print(output.getvalue())  # doctest: +NORMALIZE_WHITESPACE
+        seqid,source,feature,start,end,score,strand,phase,ID,tag
+        TEST,test,gene,121,120,.,+,-,test001,test_tag
+        <BLANKLINE>
+
+        The PyArrow engine gives the same lines, even without attributes.
+
+        >>> import pytest
+        >>> _ = pytest.importorskip('pyarrow')
+        >>> from tempfile import NamedTemporaryFile
+        >>> with NamedTemporaryFile('w', suffix='.gff3', delete=False) as file:
+        ...     print("##meta1\titem1", file=file)
+        ...     print('\t'.join('TEST    test    gene    1       100     .       +       +       ID=test001'.split()), 
+        ...           file=file)
+        ...     print("# comment", file=file)
+        >>> GffFile.from_file_fast(file.name, engine='pyarrow').write()  # doctest: +NORMALIZE_WHITESPACE
+        ##meta1 item1
+        TEST    test    gene    1       100     .       +       +       ID=test001
+        >>> with open(file.name, 'a') as f:
+        ...     print('\t'.join('TEST    test    gene    121       120     .       +       -'.split()), 
+        ...           file=f)
+        >>> GffFile.from_file_fast(file.name, engine='pyarrow').write()  # doctest: +NORMALIZE_WHITESPACE
+        ##meta1 item1
+        TEST    test    gene    1       100     .       +       +       ID=test001
+        TEST    test    gene    121     120     .       +       -
+        >>> GffFile.from_file(file.name).write()  # doctest: +NORMALIZE_WHITESPACE
+        ##meta1 item1
+        TEST    test    gene    1       100     .       +       +       ID=test001
+        TEST    test    gene    121     120     .       +       -
+        >>> os.remove(file.name)
+
+        """
+
+        file = _cast_to_file_handle(file)
+
+        if not file.seekable():
+
+            return cls.from_file(file, lookup=lookup)
+
+        filename = getattr(file, 'name', None)
+
+        if engine is None:
+
+            engine = ('pyarrow' if _ARROW_AVAILABLE and isinstance(filename, str) 
+                      else 'c')
+
+        if engine not in ('c', 'pyarrow'):
+
+            raise ValueError(f"Engine must be one of ['c', 'pyarrow'], but was {engine}.")
+
+        if engine == 'pyarrow' and not _ARROW_AVAILABLE:
+
+            raise ImportError("PyArrow not installed. Try installing with pip:\n"
+                              "\t$ pip install pyarrow")
+
+        if engine == 'pyarrow' and not isinstance(filename, str):
+
+            raise ValueError("The 'pyarrow' engine can only read named files.")
+
+        metadata = []
+
+        with file:
+
+            position = file.tell()
+            line = file.readline()
+
+            while line.startswith('#'):
+
+                metadata.append(cls._parse_metadatum(line.strip()))
+                position = file.tell()
+                line = file.readline()
+
+            if engine == 'pyarrow':
+
+                try:
+
+                    table = cls._read_table_arrow(filename, 
+                                                  skip_rows=len(metadata))
+
+                except pa.ArrowInvalid:
+
+                    # for example, rows without attributes, which PyArrow 
+                    # can't fill in but the C parser can
+                    engine = 'c'
+
+            if engine == 'c':
+
+                file.seek(position)
+                table = cls._read_table_c(file)
+
+        return cls._from_table(cls._clean_table(table), 
+                               metadata=metadata, 
+                               lookup=lookup)
     
 
     def write(self, 
@@ -803,15 +1631,27 @@ class GffFile:
         ----------
         file : TextIO
             File handle such as on generated by `open(f, mode='w')`.
+            Default: `sys.stdout`.
 
         """
 
         self.metadata.write(file=file)
+        file = sys.stdout if file is None else file
 
-        for line in self.lines:
+        for batch in batched(map(str, self.lines), _WRITE_BATCH_SIZE):
 
-            line.write(file=file)
+            file.write('\n'.join(batch) + '\n')
 
         return None
 
 
+def _parse_byte_range(filename: str,
+                      start: int,
+                      end: int) -> DataFrame:
+
+    with open(filename, 'rb') as f:
+
+        f.seek(start)
+        chunk = f.read(end - start)
+
+    return GffFile._clean_table(GffFile._read_table_c(BytesIO(chunk)))
@@ -1,8 +1,279 @@
 """Utilities for working with tables."""
 
-from carabiner.decorators import vectorize
+from typing import Callable, Iterable, List, Optional, Tuple, Union
+import csv
+from functools import lru_cache, partial
+from importlib.util import find_spec
+from io import TextIOWrapper
+import os
+import sys
 
-@vectorize
-def _sanitize_columns(x: str) -> str:
+from pandas import DataFrame, read_csv, read_excel
+from pandas import __version__ as _PANDAS_VERSION
 
-    return x.replace(' ', '_').replace('(', '').replace(')', '')
+try:
+    import pyarrow as pa
+    from pyarrow import csv as pacsv
+except ImportError:
+    pa, pacsv = None, None
+    _ARROW_AVAILABLE = False
+else:
+    _ARROW_AVAILABLE = True
+
+_DATACLASS_SLOTS = dict(slots=True) if sys.version_info >= (3, 10) else {}
+
+_CALAMINE_AVAILABLE = find_spec('python_calamine') is not None
+
+_FILE_TYPES = {'.csv': partial(read_csv, sep=',', engine='c'),
+               '.tsv': partial(read_csv, sep='\t', engine='c'),
+               '.txt': partial(read_csv, sep='\t', engine='c'),
+               '.xlsx': read_excel}
+
+# pandas only has the calamine engine from version 2.2
+if (_CALAMINE_AVAILABLE and 
+    tuple(int(v) for v in _PANDAS_VERSION.split('.')[:2]) >= (2, 2)):
+
+    _FILE_TYPES.update({suffix: partial(read_excel, engine='calamine')
+                        for suffix in ('.xlsx', '.xls', '.xlsb', '.ods')})
+
+_COMPRESSION_SUFFIXES = ('.gz', '.bz2', '.xz', '.zip', '.zst')
+
+@lru_cache(maxsize=128)
+def _sanitize_columns_cached(x: Tuple[str, ...]) -> Tuple[str, ...]:
+
+    return tuple(str(item).replace(' ', '_').replace('(', '').replace(')', '') for item in x)
+
+
+def _sanitize_columns(x: Iterable[str]) -> List[str]:
+
+    """Make column names safe to use as identifiers.
+
+    Examples
+    --------
+    >>> _sanitize_columns(['seq title', 'extra (3)', 2020])
+    ['seq_title', 'extra_3', '2020']
+
+    """
+
+    # every chunk of a table has the same header
+    return list(_sanitize_columns_cached(tuple(x)))
+
+
+def _with_sanitized_columns(table: DataFrame) -> DataFrame:
+
+    table.columns = _sanitize_columns(table.columns)
+
+    return table
+
+
+def _read_csv_arrow(file: Union[str, TextIOWrapper],
+                    sep: str,
+                    chunksize: Optional[int] = None,
+                    usecols: Optional[Callable[[str], bool]] = None,
+                    **kwargs) -> Union[DataFrame, Iterable[DataFrame]]:
+
+    """Read a delimited table of strings with PyArrow.
+
+    With `chunksize`, yields a table from each block read.
+
+    Examples
+    --------
+    >>> import pytest
+    >>> _ = pytest.importorskip('pyarrow')
+    >>> from io import BytesIO
+    >>> data = b"name,seq,score\\na,ATG,3\\nb,CCC,abc\\n"
+    >>> _read_csv_arrow(BytesIO(data), sep=',')
+      name  seq score
+    0    a  ATG     3
+    1    b  CCC   abc
+    >>> for table in _read_csv_arrow(BytesIO(data), sep=',', chunksize=1, 
+    ...                              usecols=lambda name: name != 'seq'):
+    ...     print(table)
+      name score
+    0    a     3
+    1    b   abc
+    >>> os.environ['BIOINO_FAST_IO'] = '1'
+    >>> _sniff_format('table.csv').func.__name__
+    '_read_csv_arrow'
+    >>> del os.environ['BIOINO_FAST_IO']
+
+    """
+
+    file = getattr(file, 'buffer', file)  # PyArrow needs bytes
+    parse_options = pacsv.ParseOptions(delimiter=sep)
+
+    # column types are fixed by the first block, so read everything 
+    # as strings, which needs the column names first
+    if isinstance(file, str):
+
+        header_reader = pacsv.open_csv(file, parse_options=parse_options)
+        names = header_reader.schema.names
+        header_reader.close()
+        skip_rows = 1
+
+    else:
+
+        names = next(csv.reader([file.readline().decode()], delimiter=sep))
+        skip_rows = 0
+
+    read_options = pacsv.ReadOptions(column_names=names, 
+                                     skip_rows=skip_rows)
+    convert_options = pacsv.ConvertOptions(column_types={name: pa.string() for name in names},
+                                           include_columns=[name for name in names 
+                                                            if usecols is None or usecols(name)],
+                                           strings_can_be_null=True)
+
+    if chunksize is None:
+
+        return pacsv.read_csv(file, 
+                              read_options=read_options,
+                              parse_options=parse_options,
+                              convert_options=convert_options).to_pandas()
+
+    else:
+
+        # chunks are blocks of bytes rather than a number of rows
+        reader = pacsv.open_csv(file, 
+                                read_options=read_options,
+                                parse_options=parse_options,
+                                convert_options=convert_options)
+
+        return (batch.to_pandas() for batch in reader)
+
+
+def _sniff_format(file: Union[str, TextIOWrapper],
+                  format: Optional[str] = None) -> Callable:
+
+    """Get the table reader for a file from its extension or `format`.
+
+    Examples
+    --------
+    >>> _sniff_format('table.csv').keywords
+    {'sep': ',', 'engine': 'c'}
+    >>> _sniff_format('table.csv.gz').keywords
+    {'sep': ',', 'engine': 'c'}
+    >>> _sniff_format('-').keywords
+    {'sep': '\\t', 'engine': 'c'}
+    >>> _sniff_format('-', format='CSV').keywords
+    {'sep': ',', 'engine': 'c'}
+
+    """
+
+    if format is not None:
+
+        suffix = '.' + format.casefold()
+
+    else:
+
+        filename = getattr(file, 'name', file)
+        filename = filename.casefold() if isinstance(filename, str) else ''
+        filename, suffix = os.path.splitext(filename)
+
+        if suffix in _COMPRESSION_SUFFIXES:  # for example, .csv.gz
+
+            suffix = os.path.splitext(filename)[-1]
+
+    reader = _FILE_TYPES.get(suffix, _FILE_TYPES['.tsv'])
+
+    if (os.environ.get('BIOINO_FAST_IO') == '1' and _ARROW_AVAILABLE 
+        and getattr(reader, 'func', None) is read_csv):
+
+        reader = partial(_read_csv_arrow, sep=reader.keywords['sep'])
+
+    return reader
+
+
+def _load_table(file: Union[str, TextIOWrapper],
+                format: Optional[str] = None,
+                chunksize: Optional[int] = None,
+                sheet_name: Union[str, int] = 0,
+                columns: Optional[Iterable[str]] = None,
+                **kwargs) -> Union[DataFrame, Iterable[DataFrame]]:
+
+    """Load a table with sanitized column names, optionally in chunks.
+
+    Every column is read as strings, whatever the format and chunking, 
+    so values are written as they appear in the input. Missing values 
+    are NaN.
+
+    Examples
+    --------
+    >>> import gzip
+    >>> import pytest
+    >>> from tempfile import NamedTemporaryFile
+    >>> with NamedTemporaryFile('wb', suffix='.csv.gz', delete=False) as file:
+    ...     _ = file.write(gzip.compress(b"seq title,id,extra (3)\\nATG,a,1\\nCCC,b,x\\nGGG,c,2\\n"))
+    >>> _load_table(file.name)
+      seq_title id extra_3
+    0       ATG  a       1
+    1       CCC  b       x
+    2       GGG  c       2
+    >>> for table in _load_table(file.name, chunksize=2, 
+    ...                          columns=['seq title', 'extra_3']):
+    ...     print(table)
+      seq_title extra_3
+    0       ATG       1
+    1       CCC       x
+      seq_title extra_3
+    2       GGG       2
+    >>> os.remove(file.name)
+    >>> from io import StringIO
+    >>> stdin, sys.stdin = sys.stdin, StringIO("seq\\tscore\\nATG\\t3\\nCCC\\t3.5\\n")
+    >>> for table in _load_table('-', chunksize=1):
+    ...     print(table)
+       seq score
+    0  ATG     3
+       seq score
+    1  CCC   3.5
+    >>> sys.stdin = StringIO("seq\\tscore\\nATG\\t3\\nCCC\\t3.5\\n")
+    >>> _load_table('-')['score'].tolist()
+    ['3', '3.5']
+    >>> sys.stdin = stdin
+
+    Excel files can have numeric column labels.
+
+    >>> _ = pytest.importorskip('openpyxl')
+    >>> with NamedTemporaryFile('wb', suffix='.xlsx', delete=False) as file:
+    ...     DataFrame({'seq': ['ATG'], 'id': ['a'], 2020: [1]}).to_excel(file, index=False)
+    >>> _load_table(file.name, columns=['seq', '2020'])
+       seq 2020
+    0  ATG    1
+    >>> os.remove(file.name)
+
+    """
+
+    reader = _sniff_format(file, format=format)
+    is_excel = getattr(reader, 'func', reader) is read_excel
+
+    if file == '-':
+
+        file = sys.stdin.buffer if is_excel else sys.stdin
+
+    if columns is not None:
+
+        # only parse the wanted columns, matching them after sanitizing
+        columns = set(_sanitize_columns(columns))
+        kwargs['usecols'] = lambda name: _sanitize_columns([name])[0] in columns
+
+    if is_excel:
+
+        kwargs['sheet_name'] = sheet_name
+
+    # inferring types per chunk or per format would render the same 
+    # column differently depending on where chunks start or the input
+    kwargs['dtype'] = str
+
+    if chunksize is None:
+
+        return _with_sanitized_columns(reader(file, **kwargs))
+
+    elif getattr(reader, 'func', None) in (read_csv, _read_csv_arrow):
+
+        tables = reader(file, chunksize=chunksize, **kwargs)
+
+    else:
+
+        # whole table is read at once
+        tables = [reader(file, **kwargs)]
+
+    return (_with_sanitized_columns(table) for table in tables)